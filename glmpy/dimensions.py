@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import math
 import warnings
 import numpy as np
@@ -147,16 +149,14 @@ class InvertedTruncatedPyramid:
 
         Private method for calculating volumes.
         """
-        volumes = []
-        for i in np.linspace(start=0, stop=height, num=num_vals):
-            volume = (
-                (base_length * base_width * i) + 
-                ((i**2) * (base_length / side_slope)) +
-                ((i**2) * (base_width / side_slope)) +
-                ((4 * (i**3)) / (3 * (side_slope**2)))
-            )
-            volumes.append(volume)
-        return volumes
+        i = np.linspace(start=0, stop=height, num=num_vals)
+        volumes = (
+            (base_length * base_width * i) + 
+            ((i**2) * (base_length / side_slope)) +
+            ((i**2) * (base_width / side_slope)) +
+            ((4 * (i**3)) / (3 * (side_slope**2)))
+        )
+        return volumes.tolist()
 
     def _calc_areas(
         self,
@@ -170,15 +170,12 @@ class InvertedTruncatedPyramid:
 
         Private method for calculating areas.
         """
-        areas = []
-        for i in np.linspace(start=0, stop=height, num=num_vals):
-            area = (
-                (base_length + ((2 * i) / side_slope)) *
-                (base_width + ((2 * i) / side_slope))
-            )
-
-            areas.append(area)
-        return areas
+        i = np.linspace(start=0, stop=height, num=num_vals)
+        areas = (
+            (base_length + ((2 * i) / side_slope)) *
+            (base_width + ((2 * i) / side_slope))
+        )
+        return areas.tolist()
     
     def _calc_heights(
         self,
@@ -190,11 +187,8 @@ class InvertedTruncatedPyramid:
 
         Private method for calculating heights.
         """
-        heights = np.linspace(0, -height, num_vals)
-        heights = heights.tolist()
-        heights = heights[::-1]
-        heights = [height + surface_elevation for height in heights]
-        return heights
+        heights = np.linspace(0, -height, num_vals)[::-1] + surface_elevation
+        return heights.tolist()
     
     def get_volumes(self) -> list[float]:
         """Calculates volumes.
@@ -406,15 +400,13 @@ class InvertedTruncatedSquarePyramid:
 
         Private method for calculating volumes.
         """
-        volumes = []
-        for i in np.linspace(start=0, stop=height, num=num_vals):
-            volume = (
-                ((base_length**2) * i) + 
-                (2 * (i**2) * (base_length/side_slope)) +
-                ((4 * (i**3)) / (3 * (side_slope**2)))
-            )
-            volumes.append(volume)
-        return volumes
+        i = np.linspace(start=0, stop=height, num=num_vals)
+        volumes = (
+            ((base_length**2) * i) + 
+            (2 * (i**2) * (base_length/side_slope)) +
+            ((4 * (i**3)) / (3 * (side_slope**2)))
+        )
+        return volumes.tolist()
     
     def _calc_areas(
         self,
@@ -427,11 +419,9 @@ class InvertedTruncatedSquarePyramid:
 
         Private method for calculating areas.
         """
-        areas = []
-        for i in np.linspace(start=0, stop=height, num=num_vals):
-            area = (base_length + ((2*i)/side_slope))**2
-            areas.append(area)
-        return areas
+        i = np.linspace(start=0, stop=height, num=num_vals)
+        areas = (base_length + ((2*i)/side_slope))**2
+        return areas.tolist()
     
     def _calc_heights(
         self,
@@ -443,11 +433,8 @@ class InvertedTruncatedSquarePyramid:
 
         Private method for calculating heights.
         """
-        heights = np.linspace(0, -height, num_vals)
-        heights = heights.tolist()
-        heights = heights[::-1]
-        heights = [height + surface_elevation for height in heights]
-        return heights
+        heights = np.linspace(0, -height, num_vals)[::-1] + surface_elevation
+        return heights.tolist()
             
     def get_volumes(self) -> list[float]:
         self.volumes = self._calc_volumes(
@@ -593,17 +580,15 @@ class InvertedTruncatedCone:
 
         Private method for calculating volumes.
         """
-        volumes = []
-        for i in np.linspace(start=0, stop=height, num=num_vals):
-            volume = (
-                (1 / 3) * math.pi * i * (
-                    (3 * (base_radius ** 2)) + 
-                    ((3 * base_radius * i) / side_slope) +
-                    ((i ** 2) / (side_slope ** 2))
-                )
+        i = np.linspace(start=0, stop=height, num=num_vals)
+        volumes = (
+            (1 / 3) * math.pi * i * (
+                (3 * (base_radius ** 2)) + 
+                ((3 * base_radius * i) / side_slope) +
+                ((i ** 2) / (side_slope ** 2))
             )
-            volumes.append(volume)
-        return volumes
+        )
+        return volumes.tolist()
     
     def _calc_areas(
         self,
@@ -616,11 +601,9 @@ class InvertedTruncatedCone:
 
         Private method for calculating areas.
         """
-        areas = []
-        for i in np.linspace(start=0, stop=height, num=num_vals):
-            area = math.pi * ((base_radius + (i /  side_slope)) ** 2)
-            areas.append(area)
-        return areas
+        i = np.linspace(start=0, stop=height, num=num_vals)
+        areas = math.pi * ((base_radius + (i /  side_slope)) ** 2)
+        return areas.tolist()
     
     def _calc_heights(
         self,
@@ -632,11 +615,8 @@ class InvertedTruncatedCone:
 
         Private method for calculating heights.
         """
-        heights = np.linspace(0, -height, num_vals)
-        heights = heights.tolist()
-        heights = heights[::-1]
-        heights = [height + surface_elevation for height in heights]
-        return heights   
+        heights = np.linspace(0, -height, num_vals)[::-1] + surface_elevation
+        return heights.tolist()   
     
     def get_volumes(self) -> list[float]:
         """Calculates volumes
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import json
 import os
 
@@ -36,6 +38,7 @@ class JSONReader:
 
         self.json_file = json_file
         self.nml_file = nml_file
+        self._json_data = None
 
     def read_json(self) -> dict:
         """Read a JSON file of `.nml` parameters. 
@@ -68,8 +71,9 @@ class JSONReader:
         >>> json_to_nml = glm_json.JSONReader("config.json")
         >>> json_to_nml.get_nml_blocks()
         """
-        json_data = self.read_json()
-        return list(json_data.keys())
+        if self._json_data is None:
+            self._json_data = self.read_json()
+        return list(self._json_data.keys())
 
     def get_nml_parameters(self, nml_block: str) -> dict:
         """Get the model parameters for a GLM configuration block.
@@ -97,5 +101,6 @@ class JSONReader:
         >>> setup = nml.NMLSetup()
         >>> setup.set_attributes(setup_dict)
         """
-        json_data = self.read_json()
-        return json_data[nml_block]
+        if self._json_data is None:
+            self._json_data = self.read_json()
+        return self._json_data[nml_block]
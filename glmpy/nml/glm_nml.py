@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import warnings
 
 from .nml import _BaseBlock, NMLWriter
@@ -30,6 +32,13 @@ def _deprecated_class_warning(
     )
     return warn
 
+# NML block names in the order they are written by `GLMNML.write_nml()`.
+_BLOCK_NAMES = (
+    "glm_setup", "mixing", "morphometry", "time", "output", 
+    "init_profiles", "meteorology", "light", "bird_model", "inflow",
+    "outflow", "sediment", "snowice", "wq_setup"
+)
+
 class GLMNML:
     """Write GLM NML files.
 
@@ -150,6 +159,12 @@ class GLMNML:
     Write the `.nml` file with the `write_nml()` method.
     >>> nml_file.write_nml(nml_file_path="glm3.nml")
     """
+    __slots__ = (
+        "glm_setup", "morphometry", "time", "init_profiles", "mixing", 
+        "output", "meteorology", "light", "bird_model", "inflow", "outflow",
+        "sediment", "snow_ice", "wq_setup"
+    )
+
     def __init__(
         self,
         glm_setup: dict,
@@ -213,21 +228,17 @@ class GLMNML:
         --------
         >>> nml_file.write_nml(nml_file_path="my_lake.nml")
         """
-        nml_dict = {}
-        block_dicts = [
+        block_dicts = (
             self.glm_setup, self.mixing, self.morphometry, self.time, 
             self.output, self.init_profiles, self.meteorology, self.light,
             self.bird_model, self.inflow, self.outflow, self.sediment,
             self.snow_ice, self.wq_setup
-        ]
-        block_names = [
-            "glm_setup", "mixing", "morphometry", "time", "output", 
-            "init_profiles", "meteorology", "light", "bird_model", "inflow",
-            "outflow", "sediment", "snowice", "wq_setup"
-        ]
-        for i in range(0, len(block_dicts)):
-            if block_dicts[i] is not None:
-                nml_dict[block_names[i]] = block_dicts[i]
+        )
+        nml_dict = {
+            block_name: block_dict
+            for block_name, block_dict in zip(_BLOCK_NAMES, block_dicts)
+            if block_dict is not None
+        }
         
         out_nml = NMLWriter(
             nml_dict=nml_dict, detect_types=False, list_len=list_len
@@ -296,6 +307,8 @@ class GLMNML:
             )
 
 class NML(GLMNML):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NML", "GLMNML", "glm_nml"),
@@ -352,6 +365,11 @@ class SetupBlock(_BaseBlock):
     ... }
     >>> glm_setup.set_attributes(glm_setup_attrs)
     """
+    __slots__ = (
+        "sim_name", "max_layers", "min_layer_vol", "min_layer_thick",
+        "max_layer_thick", "density_model", "non_avg"
+    )
+
     def __init__(
         self,
         sim_name: Union[str, None] = None,
@@ -417,6 +435,8 @@ class SetupBlock(_BaseBlock):
         
 
 class NMLGLMSetup(SetupBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NMLGLMSetup", "SetupBlock", "glm_nml"),
@@ -481,6 +501,11 @@ class MixingBlock(_BaseBlock):
     ... }
     >>> mixing.set_attributes(mixing_attrs)
     """
+    __slots__ = (
+        "surface_mixing", "coef_mix_conv", "coef_wind_stir", "coef_mix_shear",
+        "coef_mix_turb", "coef_mix_KH", "deep_mixing", "coef_mix_hyp", "diff"
+    )
+
     def __init__(
         self,
         surface_mixing: Union[int, None] = None,
@@ -551,6 +576,8 @@ class MixingBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLMixing(MixingBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NMLMixing", "MixingBlock", "glm_nml"),
@@ -609,6 +636,11 @@ class WQSetupBlock(_BaseBlock):
     ... }
     >>> wq_setup.set_attributes(wq_setup_attrs)
     """
+    __slots__ = (
+        "wq_lib", "wq_nml_file", "bioshade_feedback", "mobility_off",
+        "ode_method", "split_factor", "repair_state"
+    )
+
     def __init__(
         self,
         wq_lib: Union[str, None] = None,
@@ -673,6 +705,8 @@ class WQSetupBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLWQSetup(WQSetupBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NMLWQSetup", "WQSetupBlock", "glm_nml"),
@@ -755,6 +789,11 @@ class MorphometryBlock(_BaseBlock):
     ... }
     >>> morphometry.set_attributes(morphometry_attrs)
     """
+    __slots__ = (
+        "lake_name", "latitude", "longitude", "base_elev", "crest_elev",
+        "bsn_len", "bsn_wid", "bsn_vals", "H", "A"
+    )
+
     def __init__(
         self,
         lake_name: Union[str, None] = None,
@@ -828,6 +867,8 @@ class MorphometryBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLMorphometry(MorphometryBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning(
@@ -883,6 +924,10 @@ class TimeBlock(_BaseBlock):
     ... }
     >>> time.set_attributes(time_attrs)
     """
+    __slots__ = (
+        "timefmt", "start", "stop", "dt", "num_days", "timezone"
+    )
+
     def __init__(
         self,
         timefmt: Union[int, None] = None,
@@ -944,6 +989,8 @@ class TimeBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLTime(TimeBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NMLTime", "TimeBlock", "glm_nml"),
@@ -1032,6 +1079,18 @@ class OutputBlock(_BaseBlock):
     ... }
     >>> output.set_attributes(output_attrs)
     """
+    __slots__ = (
+        "out_dir", "out_fn", "nsave", "csv_lake_fname", "csv_point_nlevs",
+        "csv_point_fname", "csv_point_frombot", "csv_point_at",
+        "csv_point_nvars", "csv_point_vars", "csv_outlet_allinone",
+        "csv_outlet_fname", "csv_outlet_nvars", "csv_outlet_vars",
+        "csv_ovrflw_fname"
+    )
+    _list_params = (
+        "csv_point_frombot", "csv_point_at", "csv_point_vars",
+        "csv_outlet_vars"
+    )
+
     def __init__(
         self,
         out_dir: Union[str, None] = None,
@@ -1089,12 +1148,7 @@ class OutputBlock(_BaseBlock):
         dict[str, Any]
             A dictionary containing the configuration block parameters.
         """
-        self.csv_point_frombot = self._single_value_to_list(
-            self.csv_point_frombot
-        )
-        self.csv_point_at = self._single_value_to_list(self.csv_point_at)
-        self.csv_point_vars = self._single_value_to_list(self.csv_point_vars)    
-        self.csv_outlet_vars = self._single_value_to_list(self.csv_outlet_vars)       
+        self._single_values_to_lists()
         if check_params:
             warnings.warn(
                 "As of glm-py 0.2.0, error checking with check_params is not"
@@ -1129,6 +1183,8 @@ class OutputBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLOutput(OutputBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NMLOutput", "OutputBlock", "glm_nml"),
@@ -1220,6 +1276,15 @@ class InitProfilesBlock(_BaseBlock):
     ... }
     >>> init_profiles.set_attributes(init_profiles_attrs)
     """
+    __slots__ = (
+        "lake_depth", "num_depths", "the_depths", "the_temps", "the_sals",
+        "num_wq_vars", "wq_names", "wq_init_vals", "restart_variables"
+    )
+    _list_params = (
+        "the_depths", "the_temps", "the_sals", "wq_names", "wq_init_vals",
+        "restart_variables"
+    )
+
     def __init__(
         self,
         lake_depth: Union[float, None] = None,
@@ -1265,12 +1330,7 @@ class InitProfilesBlock(_BaseBlock):
         dict[str, Any]
             A dictionary containing the configuration block parameters.
         """
-        self.the_depths = self._single_value_to_list(self.the_depths)
-        self.the_temps = self._single_value_to_list(self.the_temps)
-        self.the_depths = self._single_value_to_list(self.the_depths)
-        self.wq_names = self._single_value_to_list(self.wq_names)
-        self.wq_init_vals = self._single_value_to_list(self.wq_init_vals)
-        self.restart_variables = self._single_value_to_list(self.restart_variables)
+        self._single_values_to_lists()
         if check_params:
             warnings.warn(
                 "As of glm-py 0.2.0, error checking with check_params is not"
@@ -1298,6 +1358,8 @@ class InitProfilesBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLInitProfiles(InitProfilesBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning(
@@ -1359,6 +1421,12 @@ class LightBlock(_BaseBlock):
     ... }
     >>> light.set_attributes(light_attrs)
     """
+    __slots__ = (
+        "light_mode", "Kw", "Kw_file", "n_bands", "light_extc", "energy_frac",
+        "Benthic_Imin"
+    )
+    _list_params = ("light_extc", "energy_frac")
+
     def __init__(
         self,
         light_mode: Union[int, None] = None,
@@ -1398,8 +1466,7 @@ class LightBlock(_BaseBlock):
         dict[str, Any]
             A dictionary containing the configuration block parameters.
         """
-        self.light_extc = self._single_value_to_list(self.light_extc)   
-        self.energy_frac = self._single_value_to_list(self.energy_frac)
+        self._single_values_to_lists()
         if check_params:
             warnings.warn(
                 "As of glm-py 0.2.0, error checking with check_params is not"
@@ -1425,6 +1492,8 @@ class LightBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLLight(LightBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NMLLight", "LightBlock", "glm_nml"),
@@ -1478,6 +1547,10 @@ class BirdModelBlock(_BaseBlock):
     ... }
     >>> bird_model.set_attributes(bird_model_attrs)
     """
+    __slots__ = (
+        "AP", "Oz", "WatVap", "AOD500", "AOD380", "Albedo"
+    )
+
     def __init__(
         self,
         AP: Union[float, None] = None,
@@ -1539,6 +1612,8 @@ class BirdModelBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLBirdModel(BirdModelBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning(
@@ -1612,6 +1687,16 @@ class SedimentBlock(_BaseBlock):
     ... }
     >>> sediment.set_attributes(sediment_attrs)
     """
+    __slots__ = (
+        "sed_heat_Ksoil", "sed_temp_depth", "sed_temp_mean",
+        "sed_temp_amplitude", "sed_temp_peak_doy", "benthic_mode", "n_zones",
+        "zone_heights", "sed_reflectivity", "sed_roughness"
+    )
+    _list_params = (
+        "sed_temp_mean", "sed_temp_amplitude", "sed_temp_peak_doy",
+        "zone_heights", "sed_reflectivity", "sed_roughness"
+    )
+
     def __init__(
         self,
         sed_heat_Ksoil: Union[float, None] = None,
@@ -1657,18 +1742,7 @@ class SedimentBlock(_BaseBlock):
         dict[str, Any]
             A dictionary containing the configuration block parameters.
         """
-        self.sed_temp_mean = self._single_value_to_list(self.sed_temp_mean)
-        self.sed_temp_amplitude = self._single_value_to_list(
-            self.sed_temp_amplitude
-        )
-        self.sed_temp_peak_doy = self._single_value_to_list(
-            self.sed_temp_peak_doy
-        )
-        self.zone_heights = self._single_value_to_list(self.zone_heights)
-        self.sed_reflectivity = self._single_value_to_list(
-            self.sed_reflectivity
-        )
-        self.sed_roughness = self._single_value_to_list(self.sed_roughness)
+        self._single_values_to_lists()
         if check_params:
             warnings.warn(
                 "As of glm-py 0.2.0, error checking with check_params is not"
@@ -1697,6 +1771,8 @@ class SedimentBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLSediment(SedimentBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning(
@@ -1741,6 +1817,10 @@ class SnowIceBlock(_BaseBlock):
     ... }
     >>> snow_ice.set_attributes(snow_ice_attrs)
     """
+    __slots__ = (
+        "snow_albedo_factor", "snow_rho_min", "snow_rho_max"
+    )
+
     def __init__(
         self,
         snow_albedo_factor: Union[float, None] = None,
@@ -1793,6 +1873,8 @@ class SnowIceBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLSnowIce(SnowIceBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NMLSnowIce", "SnowIceBlock", "glm_nml"),
@@ -1929,6 +2011,15 @@ class MeteorologyBlock(_BaseBlock):
     ... }
     >>> meteorology.set_attributes(meteorology_attrs)
     """
+    __slots__ = (
+        "met_sw", "meteo_fl", "subdaily", "time_fmt", "rad_mode",
+        "albedo_mode", "sw_factor", "lw_type", "cloud_mode", "lw_factor",
+        "atm_stab", "rh_factor", "at_factor", "ce", "ch", "rain_sw",
+        "rain_factor", "catchrain", "rain_threshold", "runoff_coef", "cd",
+        "wind_factor", "fetch_mode", "Aws", "Xws", "num_dir", "wind_dir",
+        "fetch_scale"
+    )
+
     def __init__(
         self,
         met_sw: Union[bool, None] = None,
@@ -2056,6 +2147,8 @@ class MeteorologyBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLMeteorology(MeteorologyBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning(
@@ -2146,6 +2239,18 @@ class InflowBlock(_BaseBlock):
     >>> inflow.set_attributes(inflow_attrs)
     """
 
+    __slots__ = (
+        "num_inflows", "names_of_strms", "subm_flag", "subm_elev",
+        "strm_hf_angle", "strmbd_slope", "strmbd_drag", "coef_inf_entrain",
+        "inflow_factor", "inflow_fl", "inflow_varnum", "inflow_vars",
+        "time_fmt"
+    )
+    _list_params = (
+        "names_of_strms", "subm_flag", "subm_elev", "strm_hf_angle",
+        "strmbd_slope", "strmbd_drag", "coef_inf_entrain", "inflow_factor",
+        "inflow_fl", "inflow_vars"
+    )
+
     def __init__(
         self,
         num_inflows: Union[int, None] = None,
@@ -2201,18 +2306,7 @@ class InflowBlock(_BaseBlock):
         dict[str, Any]
             A dictionary containing the configuration block parameters.
         """
-        self.names_of_strms = self._single_value_to_list(self.names_of_strms)
-        self.subm_flag = self._single_value_to_list(self.subm_flag)
-        self.subm_elev = self._single_value_to_list(self.subm_elev)
-        self.strm_hf_angle = self._single_value_to_list(self.strm_hf_angle)
-        self.strmbd_slope = self._single_value_to_list(self.strmbd_slope)
-        self.strmbd_drag = self._single_value_to_list(self.strmbd_drag)
-        self.coef_inf_entrain = self._single_value_to_list(
-            self.coef_inf_entrain
-        )
-        self.inflow_factor = self._single_value_to_list(self.inflow_factor)
-        self.inflow_fl = self._single_value_to_list(self.inflow_fl)
-        self.inflow_vars = self._single_value_to_list(self.inflow_vars)
+        self._single_values_to_lists()
         if check_params:
             warnings.warn(
                 "As of glm-py 0.2.0, error checking with check_params is not"
@@ -2250,6 +2344,8 @@ class InflowBlock(_BaseBlock):
         return self.get_params(check_params=check_errors)
 
 class NMLInflow(InflowBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NMLInflow", "InflowBlock", "glm_nml"),
@@ -2369,6 +2465,21 @@ class OutflowBlock(_BaseBlock):
     ... }
     >>> outflow.set_attributes(outflow_attrs)
     """
+    __slots__ = (
+        "num_outlet", "outflow_fl", "time_fmt", "outflow_factor",
+        "outflow_thick_limit", "single_layer_draw", "flt_off_sw",
+        "outlet_type", "outl_elvs", "bsn_len_outl", "bsn_wid_outl", "crit_O2",
+        "crit_O2_dep", "crit_O2_days", "outlet_crit", "O2name", "O2idx",
+        "target_temp", "min_lake_temp", "fac_range_upper", "fac_range_lower",
+        "mix_withdraw", "coupl_oxy_sw", "withdrTemp_fl", "seepage",
+        "seepage_rate", "crest_width", "crest_factor"
+    )
+    _list_params = (
+        "outflow_fl", "outflow_factor", "outflow_thick_limit",
+        "single_layer_draw", "flt_off_sw", "outlet_type", "outl_elvs",
+        "bsn_len_outl", "bsn_wid_outl"
+    )
+
     def __init__(
         self,
         num_outlet: Union[int, None] = None,
@@ -2454,19 +2565,7 @@ class OutflowBlock(_BaseBlock):
         dict[str, Any]
             A dictionary containing the configuration block parameters.
         """
-        self.outflow_fl = self._single_value_to_list(self.outflow_fl)
-        self.outflow_factor = self._single_value_to_list(self.outflow_factor)
-        self.outflow_thick_limit = self._single_value_to_list(
-            self.outflow_thick_limit
-        )
-        self.single_layer_draw = self._single_value_to_list(
-            self.single_layer_draw
-        )
-        self.flt_off_sw = self._single_value_to_list(self.flt_off_sw)
-        self.outlet_type = self._single_value_to_list(self.outlet_type)
-        self.outl_elvs = self._single_value_to_list(self.outl_elvs)
-        self.bsn_len_outl = self._single_value_to_list(self.bsn_len_outl)
-        self.bsn_wid_outl = self._single_value_to_list(self.bsn_wid_outl)
+        self._single_values_to_lists()
         if check_params:
             warnings.warn(
                 "As of glm-py 0.2.0, error checking with check_params is not"
@@ -2517,6 +2616,8 @@ class OutflowBlock(_BaseBlock):
     
 
 class NMLOutflow(OutflowBlock):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn(
             _deprecated_class_warning("NMLOutflow", "OutflowBlock", "glm_nml"),
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import os
+import sys
 import json
 import warnings
 import regex as re
@@ -9,7 +12,14 @@ from typing import Union, List, Any, Callable, Dict
 class _BaseBlock(ABC):
     """
     Base class for all configuration block classes.
+
+    Subclasses declare their GLM parameters in `__slots__` so that instances
+    do not carry a per-instance `__dict__`. Parameters that GLM expects as a
+    comma-separated list are named in `_list_params`.
     """
+    __slots__ = ()
+    _list_params = ()
+
     def set_attrs(self, attrs_dict: dict):
         """Set attributes for an instance of a configuration block class.
         
@@ -80,6 +90,17 @@ class _BaseBlock(ABC):
             list_value = value
         return list_value
 
+    def _single_values_to_lists(self):
+        """Convert the single values of list parameters to lists.
+
+        Applies `_single_value_to_list` to every attribute named in the
+        `_list_params` class attribute in a single pass.
+        """
+        for param in self._list_params:
+            setattr(
+                self, param, self._single_value_to_list(getattr(self, param))
+            )
+
 class _NML:
     def set_converters(
             self, 
@@ -195,11 +216,7 @@ class _NML:
                     )
         for block_name, param_dict in converters.items():
             if block_name in default_types:
-                defaults = default_types[block_name]
-                for param_name, param_func in param_dict.items():
-                    if param_name not in defaults.items():
-                        defaults[param_name] = param_func
-                default_types[block_name] = defaults
+                default_types[block_name].update(param_dict)
             else:
                 default_types[block_name] = param_dict
         self._converters = default_types
@@ -431,16 +448,14 @@ class NMLWriter(_NML):
         if len(python_list) == 1:
             return converter_func(python_list[0])
         else:
-            list_str = ''
-            for i in range(0, len(python_list)):
-                if list_len is not None:
-                    if i + 1 > list_len and (i) % list_len == 0:
-                        list_str += '\n'
-                if i == len(python_list) - 1:
-                    list_str += converter_func(python_list[i])
-                else:
-                    list_str += converter_func(python_list[i]) + ','
-            return list_str
+            items = [converter_func(val) for val in python_list]
+            if list_len is None:
+                return ','.join(items)
+            # Join each line of list_len items, then break between lines
+            return ',\n'.join(
+                ','.join(items[i:i + list_len])
+                for i in range(0, len(items), list_len)
+            )
    
     @staticmethod
     def write_nml_param(
@@ -478,27 +493,28 @@ class NMLWriter(_NML):
         >>> print(formatted_param)
            non_avg = .true.
         """
-        def format_value(val):
-            if converter_func is not None:
-                if not isinstance(val, list):
-                    return converter_func(val)
-                lines = converter_func(val).split("\n")
-                if len(lines) == 1:
-                    return lines[0]
-                indent = " " * (len(param_name) + 6)
-                return lines[0] + "\n" + "\n".join(
-                    indent + line for line in lines[1:]
-                )
-            else:
-                return val
-        value_str = format_value(param_value) 
+        if converter_func is None:
+            value_str = param_value
+        elif not isinstance(param_value, list):
+            value_str = converter_func(param_value)
+        else:
+            # Indent the continuation lines of a multi-line list to align
+            # with the first value
+            indent = " " * (len(param_name) + 6)
+            value_str = f"\n{indent}".join(
+                converter_func(param_value).split("\n")
+            )
         return f"   {param_name} = {value_str}\n"
     
     def _write_nml(self) -> str:
-        nml_string = ""
+        nml_parts = []
+        # Bind attributes used inside the loops to locals
+        detect_types = self._detect_types
+        converters = self._converters
+        write_nml_param = NMLWriter.write_nml_param
         for block_name, param_dict in self._nml_dict.items():
-            if not self._detect_types:
-                if block_name not in self._converters:
+            if not detect_types:
+                if block_name not in converters:
                     warnings.warn(
                         f"Unexpected block '{block_name}' in the nml_dict. If "
                         "parsing this block is desired, update the "
@@ -510,12 +526,10 @@ class NMLWriter(_NML):
                         f'{{"param1": NMLWriter.write_nml_str}}}}'
                     )
                     continue
-            param_types = self._converters[block_name]
-            block_header = f"&{block_name}\n"
-            nml_string += block_header
-            block_string = ""
+            param_types = converters[block_name]
+            nml_parts.append(f"&{block_name}\n")
             for param_name, param_value in param_dict.items():
-                if not self._detect_types:
+                if not detect_types:
                     if param_name not in param_types:
                         warnings.warn(
                             f"Unexpected parameter '{param_name}' in the "
@@ -529,17 +543,16 @@ class NMLWriter(_NML):
                         )
                         continue
                 if param_value is not None:
-                    param_string = NMLWriter.write_nml_param(
+                    param_string = write_nml_param(
                         param_name=param_name,
                         param_value=param_value,
                         converter_func=param_types[param_name]
                     )
-                    block_string += param_string
+                    nml_parts.append(param_string)
                 else:
                     continue
-            block_string += "/\n"
-            nml_string += block_string
-        return nml_string
+            nml_parts.append("/\n")
+        return "".join(nml_parts)
 
     def write_nml(self, nml_file: str = "glm3.nml"):
         """Write the `.nml` file.
@@ -564,17 +577,19 @@ class NMLWriter(_NML):
     def _uniform_list_types(
             self, param_list: list, reference_type: Any
         ) -> bool:
-        uniform_types = True
         for val in param_list:
             if not isinstance(val, reference_type):
-                uniform_types = False
-        return uniform_types
+                return False
+        return True
 
     def _auto_converters(self) -> dict:
         converters = {}
         for block_name, param_dict in self._nml_dict.items():
             block_dict = {}
             for param_name, param_value in param_dict.items():
+                if param_value is None:
+                    # None values are never written so need no converter
+                    continue
                 param_type = type(param_value)
                 if param_type not in self._converter_funcs:
                     raise TypeError(
@@ -800,6 +815,18 @@ class NMLWriter(_NML):
         }
         return default_converters
 
+# Patterns used by NMLReader to parse NML files. Compiled once on import
+# rather than on every call. See the NMLReader private methods for a
+# description of each pattern.
+_LEFT_COMMENT = re.compile(r'^\s*\!.*(\n|$)', flags=re.MULTILINE)
+_RIGHT_COMMENT = re.compile(r'\s*\!.*(?=\n|$)')
+_EMPTY_LINES = re.compile(r'^\s*(\n|$)', flags=re.MULTILINE)
+_TRAILING_WHITESPACES = re.compile(r'[ \t]+(?=\n|$)')
+_LEADING_WHITESPACES = re.compile(r'[ \t]+')
+_SPLIT_BLOCKS = re.compile(r'&(\w+)\s*(.*?)\s+\/', flags=re.DOTALL)
+_SINGLE_LINE_PARAM = re.compile(r'(\w+)\s*=\s*(.+[^,])$', flags=re.MULTILINE)
+_MULTI_LINE_PARAM = re.compile(r'(\w+)\s*=\s*((?:.*,\n)+.*[^,]\n?)')
+
 class NMLReader(_NML):
     """Read NML files.
 
@@ -1103,27 +1130,22 @@ class NMLReader(_NML):
             raise TypeError(
                 f"Expected a string or a list but got type: {type(nml_list)}."
             )
-        if not isinstance(converter_func, Callable):
+        if not callable(converter_func):
             raise TypeError(
                 f"Expected a Callable but got type: {type(converter_func)}."
             )
-        if isinstance(nml_list, list):
-            for i in range(0, len(nml_list)):
-                if not isinstance(nml_list[i], str):
-                    raise TypeError(
-                        f"Expected a string for item {i} of nml_list but got "
-                        f"type: {type(nml_list[i])}"
-                    )
         if not isinstance(nml_list, list):
             nml_list = [nml_list]
         python_list = []
-        for i in nml_list:
-            i = i.strip()
-            i = i.split(",")
-            for j in i:
+        for i, item in enumerate(nml_list):
+            if not isinstance(item, str):
+                raise TypeError(
+                    f"Expected a string for item {i} of nml_list but got "
+                    f"type: {type(item)}"
+                )
+            for j in item.strip().split(","):
                 if j == '': continue
-                j = converter_func(j)
-                python_list.append(j)
+                python_list.append(converter_func(j))
         return python_list
 
     def _strip_comments(self, in_nml):
@@ -1145,19 +1167,8 @@ class NMLReader(_NML):
         more times until the presence of the end of the line. Ensures the match
         stops at either a new line or the end of the string.
         """
-        left_comment = r'^\s*\!.*(\n|$)'
-        right_comment = r'\s*\!.*(?=\n|$)'
-        nml = re.sub(
-            pattern=left_comment, 
-            repl='', 
-            string=in_nml, 
-            flags=re.MULTILINE
-        )
-        out_nml = re.sub(
-            pattern=right_comment, 
-            repl='', 
-            string=nml
-        )
+        nml = _LEFT_COMMENT.sub(repl='', string=in_nml)
+        out_nml = _RIGHT_COMMENT.sub(repl='', string=nml)
         return out_nml
 
     def _strip_empty_lines(self, in_nml):
@@ -1171,13 +1182,7 @@ class NMLReader(_NML):
         or more whitespaces. 
         `(\n|$)`: A group matching either a line break or the end of string. 
         """
-        empty_lines = r'^\s*(\n|$)'
-        out_nml = re.sub(
-            pattern=empty_lines, 
-            repl='', 
-            string=in_nml, 
-            flags=re.MULTILINE
-        )
+        out_nml = _EMPTY_LINES.sub(repl='', string=in_nml)
         return out_nml
     
     def _strip_trailing_whitespaces(self, in_nml):
@@ -1192,12 +1197,7 @@ class NMLReader(_NML):
         `(?=\n|$)`: A positive lookahead that continues matching the previous
         until it is immediately followed by a linebreak or end of the string.
         """
-        trailing_whitespaces = r'[ \t]+(?=\n|$)'
-        out_nml = re.sub(
-            pattern=trailing_whitespaces, 
-            repl='', 
-            string=in_nml
-        )
+        out_nml = _TRAILING_WHITESPACES.sub(repl='', string=in_nml)
         return out_nml
 
     def _strip_leading_whitespaces(self, nml_str):
@@ -1210,12 +1210,7 @@ class NMLReader(_NML):
         `[ \t]+`: A character class matching one or more spaces or tab 
         characters. 
         """
-        leading_whitespaces = r'[ \t]+'
-        out_str = re.sub(
-            pattern=leading_whitespaces, 
-            repl='', 
-            string=nml_str
-        )
+        out_str = _LEADING_WHITESPACES.sub(repl='', string=nml_str)
         return out_str
         
     def _split_blocks(self, in_nml):
@@ -1232,8 +1227,7 @@ class NMLReader(_NML):
         `(.*?)\s+\/`: Any characters or line breaks captured lazily followed by
         one or more spaces and a forward slash character.
         """
-        split_blocks = r'&(\w+)\s*(.*?)\s+\/'
-        out_nml = re.findall(split_blocks, in_nml, flags=re.DOTALL)
+        out_nml = _SPLIT_BLOCKS.findall(in_nml)
         return out_nml
     
     def _extract_parameters(self, nml_block):
@@ -1261,42 +1255,37 @@ class NMLReader(_NML):
         ending with a comma.
         3) Any character zero or more times, followed by any character that is 
         not a comma character, then a newline character (optional).
+
+        Block and parameter names are interned with `sys.intern` so that the
+        converter lookups in `_convert_parameters()` compare by identity.
         """
-        params = {}
-        single_line = r'(\w+)\s*=\s*(.+[^,])$'
-        multi_line = r'(\w+)\s*=\s*((?:.*,\n)+.*[^,]\n?)'
-        single_line_params = re.findall(
-            pattern=single_line, 
-            string=nml_block[1], 
-            flags=re.MULTILINE
-        )
-        multi_line_params = re.findall(
-            pattern=multi_line, 
-            string=nml_block[1]
-        )
-        for param, value in single_line_params:
-            params[param] = value
-        for param, value in multi_line_params:
-            value = self._strip_leading_whitespaces(value)
-            value = value.split("\n")
-            params[param] = value
-        block = {
-            nml_block[0]: params
+        single_line_params = _SINGLE_LINE_PARAM.findall(nml_block[1])
+        multi_line_params = _MULTI_LINE_PARAM.findall(nml_block[1])
+        params = {
+            sys.intern(param): value for param, value in single_line_params
         }
-        return block
+        params.update(
+            (
+                sys.intern(param),
+                self._strip_leading_whitespaces(value).split("\n")
+            )
+            for param, value in multi_line_params
+        )
+        return (sys.intern(nml_block[0]), params)
 
-    def _convert_parameters(self, block_dicts: List[dict]) -> dict:
+    def _convert_parameters(self, blocks: List[tuple]) -> dict:
         """Converts NML parameter values.
 
         Private method that cycles through each block of parameters in the NML
         string and applies the appropirate syntax conversion function using the
         lookup dictionary. Raises warnings when a block or parameter is in the
-        NML string but not in the lookup dictionary.
+        NML string but not in the lookup dictionary. Each item of `blocks` is
+        a `(block_name, params)` tuple returned by `_extract_parameters()`.
         """
         converted_nml = {}
-        for block in block_dicts:
-            block_name = list(block.keys())[0]
-            if block_name not in self._converters:
+        converters = self._converters
+        for block_name, block_params in blocks:
+            if block_name not in converters:
                 warnings.warn(
                     f"Unexpected block '{block_name}' in the NML file. If "
                     "parsing this block is desired, update the "
@@ -1308,9 +1297,9 @@ class NMLReader(_NML):
                     f'{{"param1": NMLReader.read_nml_str}}}}'
                 )
                 continue
-            param_types = self._converters[block_name]
+            param_types = converters[block_name]
             converted_params = {}
-            for param_name, param_val in block[block_name].items():
+            for param_name, param_val in block_params.items():
                 if param_name not in param_types:
                     warnings.warn(
                         f"Unexpected parameter '{param_name}' in the "
@@ -1339,11 +1328,11 @@ class NMLReader(_NML):
         nml_str = self._strip_empty_lines(in_nml=nml_str)
         nml_str = self._strip_trailing_whitespaces(in_nml=nml_str)
         nml_str = self._split_blocks(in_nml=nml_str)
-        block_dicts = []
+        blocks = []
         for i in nml_str:
             block = self._extract_parameters(i)
-            block_dicts.append(block)
-        nml_dict = self._convert_parameters(block_dicts)
+            blocks.append(block)
+        nml_dict = self._convert_parameters(blocks)
         return nml_dict
 
     def get_nml(self) -> dict:
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
 import pandas as pd
 import datetime as dt
 
 from typing import Mapping, Union
 
+# Number of seconds in each supported timeseries frequency. Used both to
+# validate `frequency` and to convert outflows to m^3/second.
+_FREQUENCY_SECONDS = {"24h": 86400, "1h": 3600}
+
 class CustomOutflows:
     """
     Create a simple outflow timeseries for GLM.
@@ -105,7 +111,7 @@ class CustomOutflows:
             start_datetime=start_datetime,
             end_datetime=end_datetime
         )
-        if frequency not in ["24h", "1h"]:
+        if frequency not in _FREQUENCY_SECONDS:
             raise ValueError(
                 "Invalid frequency. frequency must be '24h' (daily) or '1h' "
                 f"(hourly). Got {frequency}."
@@ -124,10 +130,7 @@ class CustomOutflows:
         self.frequency = frequency
         self.base_outflow = base_outflow
 
-        if self.frequency == "24h":
-            self.num_seconds = 86400
-        elif self.frequency == "1h":
-            self.num_seconds = 3600
+        self.num_seconds = _FREQUENCY_SECONDS[self.frequency]
         
         self.outflows = pd.DataFrame({
             "time": pd.date_range(
@@ -310,10 +313,9 @@ class CustomOutflows:
 
             validated_datetime_outflows[timestamp] = val
 
-        for key, val in validated_datetime_outflows.items():
-            self.outflows.loc[
-                self.outflows['time'] == key, 'flow'
-            ] = val/self.num_seconds
+        flows = self.outflows['time'].map(validated_datetime_outflows)
+        mask = flows.notna()
+        self.outflows.loc[mask, 'flow'] = flows[mask] / self.num_seconds
 
     def set_over_datetime(
         self,
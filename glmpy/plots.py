@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import netCDF4
 import numpy as np
 import pandas as pd
@@ -8,7 +10,7 @@ from typing import Union, List
 from matplotlib.axes import Axes
 from matplotlib.lines import Line2D
 from matplotlib.image import AxesImage
-from datetime import datetime, timedelta
+from datetime import datetime
 
 
 class LakePlotter:
@@ -48,11 +50,11 @@ class LakePlotter:
             Path to the `lake.csv` file generated by GLM
         """
         self._lake_csv = pd.read_csv(lake_csv_path)
-        days = [date.split(" ")[0] for date in list(self._lake_csv["time"])]
-        self._x_dates = [
-            datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)
-            for date in days
-        ]
+        days = self._lake_csv["time"].str.split(" ").str[0]
+        self._x_dates = (
+            pd.to_datetime(days, format="%Y-%m-%d", cache=True)
+            + pd.Timedelta(days=1)
+        ).tolist()
         self._date_formatter = mdates.DateFormatter("%d/%m/%y")
 
     def _set_default_plot_params(
@@ -545,11 +547,9 @@ class NCProfile:
                     param_dict[key] = value
 
     def _get_time(self):
-        start_datetime = datetime.strptime(
-            self._start_datetime, "%Y-%m-%d %H:%M:%S"
-        )
-        x_dates = [start_datetime + timedelta(hours=x) for x in self._time]
-        x_dates = mdates.date2num(x_dates)
+        start_datetime = self.get_start_datetime()
+        # self._time is in hours since the start time and date2num is in days
+        x_dates = mdates.date2num(start_datetime) + self._time / 24
 
         return x_dates
 
@@ -558,11 +558,9 @@ class NCProfile:
         Returns a 1D array of the lake surface height at each timestep.
         """
 
-        surface_height = ma.empty(self._num_layers.shape)
-        for i in range(0, len(self._num_layers)):
-            surface_height[i] = self._layer_heights[
-                i, self._num_layers[i] - 1, 0, 0
-            ]
+        timesteps = np.arange(len(self._num_layers))
+        top_layers = np.asarray(self._num_layers) - 1
+        surface_height = self._layer_heights[timesteps, top_layers, 0, 0]
 
         return surface_height
 
@@ -767,4 +765,6 @@ class NCProfile:
         datetime.datetime
             Start time of the GLM simulation.
         """
-        return datetime.strptime(self._start_datetime, "%Y-%m-%d %H:%M:%S")
+        # GLM writes start_time as "%Y-%m-%d %H:%M:%S", which fromisoformat
+        # parses directly without the overhead of strptime
+        return datetime.fromisoformat(self._start_datetime)
@@ -1,11 +1,25 @@
+from __future__ import annotations
+
 import json
 import os
 import shutil
 import zipfile
 import pandas as pd
 
-from typing import Union
-from fastapi import UploadFile
+from typing import Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only needed for type hints. Importing fastapi pulls in starlette and
+    # pydantic, which is avoided when running GLM locally.
+    from fastapi import UploadFile
+
+# Input files that are copied into the `aed` subdirectory of the inputs
+# directory. A frozenset so membership is tested in constant time.
+_AED_FILES = frozenset((
+    "aed.nml", "aed_phyto_pars.nml", "aed_zoop_pars.nml",
+    "aed_bivalve_pars.nml", "aed_macrophyte_pars.nml",
+    "aed_malgae_pars.nml", "aed_sed_candi_pars.nml", "aed_sdg_pars.nml"
+))
    
 class GLMSim:
     """Prepare inputs and run a GLM simulation.
@@ -79,11 +93,6 @@ class GLMSim:
             File path to directory with input files required for a GLM 
             simulation.
         """
-        aed_files = [
-            "aed.nml", "aed_phyto_pars.nml", "aed_zoop_pars.nml",
-            "aed_bivalve_pars.nml", "aed_macrophyte_pars.nml",
-            "aed_malgae_pars.nml", "aed_sed_candi_pars.nml", "aed_sdg_pars.nml"
-        ]
         if self.fast_api:
             if os.path.isdir(self.inputs_dir):
                 shutil.rmtree(self.inputs_dir)
@@ -94,7 +103,7 @@ class GLMSim:
                     nml_path = os.path.join(self.inputs_dir, f.filename)
                     with open(nml_path, "wb") as f_tmp:
                         f_tmp.write(f.file.read())
-                elif f.filename in aed_files:
+                elif f.filename in _AED_FILES:
                     os.makedirs(
                         os.path.join(self.inputs_dir, "aed"), exist_ok=True
                     )
@@ -118,7 +127,7 @@ class GLMSim:
                 if f == "glm3.nml":
                     nml_path = os.path.join(self.inputs_dir, f)
                     shutil.copy(self.input_files[f], nml_path)
-                elif f in aed_files:
+                elif f in _AED_FILES:
                     os.makedirs(
                         os.path.join(self.inputs_dir, "aed"), exist_ok=True
                     )
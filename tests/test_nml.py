@@ -609,6 +609,29 @@ def test_write_nml(
     )
     assert content == expected
 
+def test_write_nml_detect_types_none(tmp_path):
+    nml_dict = {"glm_setup": {"sim_name": "lake", "max_layers": None}}
+    nml_path = tmp_path / "test.nml"
+    nml.NMLWriter(nml_dict=nml_dict, detect_types=True).write_nml(nml_path)
+    with open(nml_path, "r") as file:
+        content = file.read()
+    assert content == "&glm_setup\n   sim_name = 'lake'\n/\n"
+
+def test_block_unknown_attr():
+    glm_setup = glm_nml.SetupBlock()
+    assert not hasattr(glm_setup, "__dict__")
+    with pytest.raises(AttributeError):
+        glm_setup.set_attrs({"foo": 1})
+
+def test_init_profiles_single_values_to_lists():
+    init_profiles = glm_nml.InitProfilesBlock(
+        the_depths=1.0, the_temps=18.0, the_sals=0.5
+    )
+    params = init_profiles.get_params()
+    assert params["the_depths"] == [1.0]
+    assert params["the_temps"] == [18.0]
+    assert params["the_sals"] == [0.5]
+
 @pytest.fixture
 def example_nml_parameters():
     return {